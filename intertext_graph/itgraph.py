@@ -1,70 +1,111 @@
 from __future__ import annotations
+from collections import defaultdict, deque
 from enum import auto, Enum
+from itertools import chain, count
 import json
-from typing import Any, Dict, Iterator, List, Optional, TextIO
-from uuid import uuid4
+import os
+import pickle
+from random import getrandbits
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, ValuesView
 
 import networkx as nx
+import numpy as np
+
+
+def _reset_uuid_counter() -> None:
+    """Node and edge UUIDs are plain integers which are cheaper to create and hash than UUID4 strings.
+
+    Start at a random offset per process, so graphs created in different processes (e.g. batch parsing) can be merged."""
+    global _uuid_counter
+    _uuid_counter = count(getrandbits(64) << 32)
+
+
+_reset_uuid_counter()
+if hasattr(os, 'register_at_fork'):
+    # Forked processes would otherwise continue with the same counter as their parent
+    os.register_at_fork(after_in_child=_reset_uuid_counter)
 
 
 class Node:
 
+    # Nodes have a fixed set of attributes, avoid a per-instance __dict__
+    __slots__ = (
+        'ix', '_uuid', 'content', 'ntype', 'meta', 'embedding', '_incoming_edges', '_outgoing_edges', '_doc', '_topo_ix'
+    )
+
     def __init__(self, content: str, ntype: str = None, meta: Dict[str, Any] = None) -> None:
         self.ix = None
-        self._uuid = str(uuid4())
+        self._uuid = next(_uuid_counter)
         self.content = content.strip()
-        self.ntype = ntype
+        # Node types are repeated across many nodes, interning shares a single string object between them
+        self.ntype = sys.intern(ntype) if isinstance(ntype, str) else ntype
         self.meta = meta
         self.embedding: Optional[Any] = None
-        # Keep track of edges by UUID and retrieve edge objects using the graph instance
-        # Necessary to break reference cycles between nodes and edges
-        # Lists are faster here then sets due to iterations in the computed properties below
-        self._incoming_edges = []
-        self._outgoing_edges = []
+        # Keep track of edges bucketed by edge type, keyed by UUID to keep insertion order and allow fast removal
+        # Edge objects are stored directly to save a lookup in the graph instance on every access
+        self._incoming_edges: Dict[Etype, Dict[int, Edge]] = defaultdict(dict)
+        self._outgoing_edges: Dict[Etype, Dict[int, Edge]] = defaultdict(dict)
         self._doc = None
+        # Position in the next graph, maintained by the graph instance and used for fast comparisons
+        self._topo_ix: Optional[int] = None
 
     @property
     def incoming_edges(self) -> List[Edge]:
-        # Prevent reference cycles by retrieving edge objects in a computed property
-        return [self._doc._edges[uuid] for uuid in self._incoming_edges]
+        return list(chain.from_iterable(bucket.values() for bucket in self._incoming_edges.values()))
 
     @property
     def outgoing_edges(self) -> List[Edge]:
-        # Prevent reference cycles by retrieving edge objects in a computed property
-        return [self._doc._edges[uuid] for uuid in self._outgoing_edges]
+        return list(chain.from_iterable(bucket.values() for bucket in self._outgoing_edges.values()))
 
     def add_edge(self, edge: Edge) -> None:
         if edge.src_node == self:
-            assert edge._uuid not in self._outgoing_edges
-            self._outgoing_edges.append(edge._uuid)
+            assert edge._uuid not in self._outgoing_edges[edge.etype]
+            self._outgoing_edges[edge.etype][edge._uuid] = edge
         elif edge.tgt_node == self:
-            assert edge._uuid not in self._incoming_edges
-            self._incoming_edges.append(edge._uuid)
+            assert edge._uuid not in self._incoming_edges[edge.etype]
+            self._incoming_edges[edge.etype][edge._uuid] = edge
 
     def remove_edge(self, edge: Edge) -> None:
         if edge.src_node == self:
-            self._outgoing_edges.remove(edge._uuid)
+            del self._outgoing_edges[edge.etype][edge._uuid]
         elif edge.tgt_node == self:
-            self._incoming_edges.remove(edge._uuid)
+            del self._incoming_edges[edge.etype][edge._uuid]
 
     def get_edges(self, etype: Etype = None, outgoing: bool = True, incoming: bool = True) -> List[Edge]:
         """Get all edges with optional filters."""
         edges = []
         if outgoing:
-            edges += [e for e in self.outgoing_edges if not etype or e.etype == etype]
+            if etype:
+                edges += self._outgoing_edges.get(etype, {}).values()
+            else:
+                edges += self.outgoing_edges
         if incoming:
-            edges += [e for e in self.incoming_edges if not etype or e.etype == etype]
+            if etype:
+                edges += self._incoming_edges.get(etype, {}).values()
+            else:
+                edges += self.incoming_edges
         return edges
 
     def __lt__(self, other: Node) -> bool:
         if not isinstance(other, Node):
             raise NotImplemented
+        if self is other:
+            return False
         assert self._doc is not None
+        if self._doc is not other._doc:
+            raise ValueError('Cannot compare nodes from different documents')
         # Check that both nodes are connected
-        assert other in self._doc.nodes
+        assert self._doc._nodes.get(other._uuid) is other
+        if not self._doc._topo_ix_valid:
+            self._doc._refresh_topo_index()
+        if self._topo_ix is not None and other._topo_ix is not None:
+            return self._topo_ix < other._topo_ix
+        # Fall back to following breadcrumbs for nodes which are not part of the next graph, e.g. span nodes
+        nodes = self._doc.nodes
         # Use node indices as a weak indicator for an optimal search direction
         # Assumption is that (most) nodes are added sequentially
-        if self._doc.nodes.index(self) < self._doc.nodes.index(other):
+        if nodes.index(self) < nodes.index(other):
             for node in self._doc.breadcrumbs(other, Etype.NEXT):
                 if node == self:
                     return True
@@ -97,13 +138,26 @@ class Etype(Enum):
     LINK = auto()
 
     def __str__(self) -> str:
-        return self.name.lower()
+        return _ETYPE_TO_STR[self]
+
+    @classmethod
+    def from_str(cls, name: str) -> Etype:
+        """Inverse of str(), also accepts other capitalizations of the name."""
+        etype = _STR_TO_ETYPE.get(name)
+        return etype if etype is not None else cls[name.upper()]
+
+
+# Precompute string representations as they are used for every edge ix and during serialization
+_ETYPE_TO_STR = {etype: etype.name.lower() for etype in Etype}
+_STR_TO_ETYPE = {name: etype for etype, name in _ETYPE_TO_STR.items()}
 
 
 class Edge:
 
+    __slots__ = ('_uuid', '_src_node', '_tgt_node', 'etype', 'meta', '_doc', '_cached_ix')
+
     def __init__(self, src_node: Node, tgt_node: Node, etype: Etype, meta: Dict[str, Any] = None) -> None:
-        self._uuid = str(uuid4())
+        self._uuid = next(_uuid_counter)
         # Keep track of src and tgt nodes by UUID and retrieve node objects using the graph instance
         # Necessary to break reference cycles between nodes and edges
         self._src_node = src_node._uuid
@@ -111,13 +165,17 @@ class Edge:
         self.etype = etype
         self.meta = meta
         self._doc = None
+        self._cached_ix: Optional[str] = None
 
     @property
     def ix(self) -> str:
         """Concatenate ix from source and target.
 
-        Use a computed property since source and / or target ix could be updated.
+        Source and / or target ix could be updated until the edge is added to a graph.
+        From then on the ix is cached.
         """
+        if self._cached_ix is not None:
+            return self._cached_ix
         assert self.src_node.ix is not None and self.tgt_node.ix is not None
         return f'{self.src_node.ix}_{self.tgt_node.ix}_{str(self.etype)}'
 
@@ -141,19 +199,29 @@ class IntertextDocument:
         # The MultiDiGraph can be used for additional features or prototyping
         self._graph = nx.MultiDiGraph()
         self._prefix = prefix
-        self.meta = meta or {}
+        # Copy to not alter the dict passed by the caller, e.g. when updating the ix counter
+        self.meta = dict(meta) if meta else {}
         if 'ix_counter' not in self.meta:
             self.meta['ix_counter'] = -1
         # Uses dicts for nodes and edges as fast internal lookup tables
-        self._nodes: Dict[str, Node] = dict()
+        self._nodes: Dict[int, Node] = dict()
         # Make mapping of node ix's to uuids
         self._node_ix_to_uuid = {}
-        self._edge_ix_to_uuid = {}
+        # The reverse lookup for edges is only built when needed, edges are mostly accessed via their nodes
+        self._edge_ix_to_uuid: Optional[Dict[str, int]] = None
         # Flag for limiting use of automagic expressions during deserialization
         self._init_from_existing_doc = False
+        # Node positions in the next graph are computed lazily and kept up to date while appending to the graph
+        self._topo_ix_valid = False
+        self._topo_ix_max = -1
+        self._root_uuid: Optional[int] = None
+        # Incremented on every change to the graph structure to invalidate cached results
+        self._mutation_version = 0
+        self._unroll_cache: Optional[List[Node]] = None
+        self._unroll_cache_version = -1
         for n in nodes:
             self.add_node(n)
-        self._edges: Dict[str, Edge] = dict()
+        self._edges: Dict[int, Edge] = dict()
         for e in edges:
             self.add_edge(e)
 
@@ -167,19 +235,39 @@ class IntertextDocument:
         # Hide UUID lookup dict from public API
         return list(self._edges.values())
 
+    @property
+    def nodes_view(self) -> ValuesView[Node]:
+        """Live view on the nodes, avoids copying when only iterating or checking membership."""
+        return self._nodes.values()
+
+    @property
+    def edges_view(self) -> ValuesView[Edge]:
+        """Live view on the edges, avoids copying when only iterating or checking membership."""
+        return self._edges.values()
+
     @property
     def root(self) -> Node:
         """Finds and returns the root node.
 
         Requires a graph containing next edges."""
-        if len(self.nodes) == 1:
+        if len(self._nodes) == 1:
             # The doc consists of only one node and no edges
-            return self.nodes[0]
-        for node in self.nodes:
-            if not node.get_edges(Etype.NEXT, outgoing=False) and node.get_edges(Etype.NEXT, incoming=False):
+            return next(iter(self._nodes.values()))
+        # The root rarely changes, check the cached node first before scanning the whole graph
+        node = self._nodes.get(self._root_uuid)
+        if node is not None and self._is_root(node):
+            return node
+        for node in self.nodes_view:
+            if self._is_root(node):
+                self._root_uuid = node._uuid
                 return node
 
+    @staticmethod
+    def _is_root(node: Node) -> bool:
+        return not node.get_edges(Etype.NEXT, outgoing=False) and bool(node.get_edges(Etype.NEXT, incoming=False))
+
     def add_node(self, node: Node) -> None:
+        self._mutation_version += 1
         # Ix counter never decreases to prohibit naming collision
         # Increase ix counter independently of existing ix to reflect the number of nodes added over time
         self.meta['ix_counter'] += 1
@@ -187,9 +275,10 @@ class IntertextDocument:
         if node.ix is None:
             node.ix = f'{self._prefix}_{self.meta["ix_counter"]}'
         # Reset edges to match this graph, e.g. in case a node has been moved from one graph to another
-        node._incoming_edges = []
-        node._outgoing_edges = []
+        node._incoming_edges = defaultdict(dict)
+        node._outgoing_edges = defaultdict(dict)
         node._doc = self
+        node._topo_ix = None
         assert node.ix not in self._node_ix_to_uuid
         self._nodes[node._uuid] = node
         self._node_ix_to_uuid[node.ix] = node._uuid
@@ -202,18 +291,95 @@ class IntertextDocument:
         self._graph.add_node(node)
 
     def add_edge(self, edge: Edge) -> None:
+        self._mutation_version += 1
         edge._doc = self
-        assert edge.ix not in self._edge_ix_to_uuid
+        # Node ix are fixed once both nodes are part of the graph
+        edge._cached_ix = None
+        edge._cached_ix = edge.ix
+        # The NetworkX graph uses the ix as key and is used to detect duplicate edges
+        assert not self._graph.has_edge(edge.src_node, edge.tgt_node, key=edge.ix)
         # Nodes have to keep track of their incoming and outgoing edges
         edge.src_node.add_edge(edge)
         edge.tgt_node.add_edge(edge)
+        if edge.etype is Etype.NEXT:
+            self._update_topo_index(edge)
         self._edges[edge._uuid] = edge
-        self._edge_ix_to_uuid[edge.ix] = edge._uuid
+        if self._edge_ix_to_uuid is not None:
+            self._edge_ix_to_uuid[edge.ix] = edge._uuid
         # Unique key required when removing overlapping edges
         self._graph.add_edge(edge.src_node, edge.tgt_node, key=edge.ix, attr={'etype': edge.etype, 'ix': edge.ix})
 
+    def _bulk_merge(self, nodes: Iterable[Node], edges: Iterable[Edge]) -> None:
+        """Adds nodes and edges of existing graphs at once, e.g. when combining multiple docs via multi graph.
+
+        Equivalent to calling add_node() and add_edge() while building from an existing IntertextDocument object,
+        i.e. no link edges are created for span nodes."""
+        self._mutation_version += 1
+        nodes = list(nodes)
+        edges = list(edges)
+        for node in nodes:
+            # Keep the ix counter consistent with add_node()
+            self.meta['ix_counter'] += 1
+            if node.ix is None:
+                node.ix = f'{self._prefix}_{self.meta["ix_counter"]}'
+            # Reset edges to match this graph
+            node._incoming_edges = defaultdict(dict)
+            node._outgoing_edges = defaultdict(dict)
+            node._doc = self
+            node._topo_ix = None
+        # Check for duplicate ix before any lookup table is modified
+        node_ix_to_uuid = {node.ix: node._uuid for node in nodes}
+        assert len(node_ix_to_uuid) == len(nodes) and self._node_ix_to_uuid.keys().isdisjoint(node_ix_to_uuid)
+        self._nodes.update((node._uuid, node) for node in nodes)
+        self._node_ix_to_uuid.update(node_ix_to_uuid)
+        for edge in edges:
+            edge._doc = self
+            edge._cached_ix = None
+            edge._cached_ix = edge.ix
+            self._nodes[edge._src_node]._outgoing_edges[edge.etype][edge._uuid] = edge
+            self._nodes[edge._tgt_node]._incoming_edges[edge.etype][edge._uuid] = edge
+        self._edges.update((edge._uuid, edge) for edge in edges)
+        if self._edge_ix_to_uuid is not None:
+            self._edge_ix_to_uuid.update((edge.ix, edge._uuid) for edge in edges)
+        self._topo_ix_valid = False
+        self._graph.add_nodes_from(nodes)
+        num_ix = self._graph.number_of_edges()
+        self._graph.add_edges_from(
+            (edge.src_node, edge.tgt_node, edge.ix, {'attr': {'etype': edge.etype, 'ix': edge.ix}}) for edge in edges
+        )
+        assert self._graph.number_of_edges() == num_ix + len(edges)
+
+    def _update_topo_index(self, edge: Edge) -> None:
+        """Extends the topological index when a next edge is appended to the end of the next graph.
+
+        Any other change invalidates the index, which is then rebuilt on the next comparison."""
+        src_node, tgt_node = edge.src_node, edge.tgt_node
+        if (self._topo_ix_valid and tgt_node._topo_ix is None
+                and src_node._topo_ix is not None and src_node._topo_ix == self._topo_ix_max):
+            self._topo_ix_max += 1
+            tgt_node._topo_ix = self._topo_ix_max
+        else:
+            self._topo_ix_valid = False
+
+    def _refresh_topo_index(self) -> None:
+        """Assigns sequential positions to all nodes reachable from a root via next edges.
+
+        Roots are visited in insertion order. Nodes outside the next graph keep None."""
+        for node in self.nodes_view:
+            node._topo_ix = None
+        topo_ix = -1
+        for node in self.nodes_view:
+            if self._is_root(node):
+                for n in self._unroll_graph(node):
+                    if n._topo_ix is None:
+                        topo_ix += 1
+                        n._topo_ix = topo_ix
+        self._topo_ix_max = topo_ix
+        self._topo_ix_valid = True
+
     def remove_node(self, node: Node) -> None:
         """Removes a node and all its adjacent edges."""
+        self._mutation_version += 1
         for edge in node.incoming_edges + node.outgoing_edges:
             self.remove_edge(edge)
         del self._nodes[node._uuid]
@@ -225,32 +391,41 @@ class IntertextDocument:
             pass
 
     def remove_edge(self, edge: Edge) -> None:
+        self._mutation_version += 1
         edge.src_node.remove_edge(edge)
         edge.tgt_node.remove_edge(edge)
+        if edge.etype is Etype.NEXT:
+            self._topo_ix_valid = False
         del self._edges[edge._uuid]
-        del self._edge_ix_to_uuid[edge.ix]
+        if self._edge_ix_to_uuid is not None:
+            del self._edge_ix_to_uuid[edge.ix]
         try:
             self._graph.remove_edge(edge.src_node, edge.tgt_node, key=edge.ix)
         except nx.exception.NetworkXError:
             # Ignore if already removed
             pass
 
+    def clone(self) -> IntertextDocument:
+        """Returns an independent deep copy of the document.
+
+        Uses a pickle round trip which is considerably faster than copy.deepcopy() for the nested node and edge objects."""
+        return pickle.loads(pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL))
+
     def save_json(self, fp: TextIO) -> None:
         fp.write(self.to_json(indent=4))
         return
 
     def to_json(self, indent=4) -> str:
+        # Convert to plain dicts upfront instead of dispatching each object to a JSON encoder
         nodes, span_nodes = [], []
-        for node in self.nodes:
+        for node in self.nodes_view:
             if isinstance(node, SpanNode):
-                span_nodes.append(node)
+                span_nodes.append(_node_to_dict(node))
             else:
-                nodes.append(node)
-        edges = []
-        for edge in self.edges:
-            edges.append(edge)
+                nodes.append(_node_to_dict(node))
+        edges = [_edge_to_dict(edge) for edge in self.edges_view]
         data = {'nodes': nodes, 'span_nodes': span_nodes, 'edges': edges, 'prefix': self._prefix, 'meta': self.meta}
-        out = json.dumps(data, cls=IntertextEncoder, indent=indent)
+        out = json.dumps(data, indent=indent)
         return out
 
     @classmethod
@@ -279,7 +454,7 @@ class IntertextDocument:
         for e in data['edges']:
             itg.add_edge(Edge(itg.get_node_by_ix(e['src_ix']),
                 itg.get_node_by_ix(e['tgt_ix']),
-                Etype[e['etype'].upper()],
+                Etype.from_str(e['etype']),
                 e['meta']))
         itg._init_from_existing_doc = False
         return itg
@@ -290,15 +465,15 @@ class IntertextDocument:
 
     def _unroll_graph(self, node: Node) -> List[Node]:
         result = []
-        breadcrumbs = []
-        queue = [node]
+        # Keep track of followed edges in insertion order, dict keys serve as an ordered set
+        # This prevents infinite loops when some nodes are visited multiple times
+        visited: Dict[int, None] = {}
+        queue = deque([node])
         while queue:
-            current_node = queue.pop(0)
+            current_node = queue.popleft()
             for e in current_node.get_edges(Etype.NEXT, incoming=False):
-                # Use breadcrumbs to keep track of followed edges
-                # This prevents infinite loops when some nodes are visited multiple times
-                if e.ix not in breadcrumbs:
-                    breadcrumbs.append(e.ix)
+                if e._uuid not in visited:
+                    visited[e._uuid] = None
                     queue.append(e.tgt_node)
 
             result.append(current_node)
@@ -310,7 +485,11 @@ class IntertextDocument:
 
         Follows next edges from the root.
         """
-        return self._unroll_graph(self.root)
+        # The result is cached until the graph is modified
+        if self._unroll_cache_version != self._mutation_version:
+            self._unroll_cache = self._unroll_graph(self.root)
+            self._unroll_cache_version = self._mutation_version
+        return list(self._unroll_cache)
 
     def breadcrumbs(self, node: Node, etype: Etype) -> Iterator[Node]:
         """Returns an ordered iterator of nodes from the given node following edges backwards to its source.
@@ -319,24 +498,36 @@ class IntertextDocument:
 
         If there are multiple parallel path for the specified edge type only one will be returned.
         The one picked does not have to be the shortest path. This does not affect `parent` and `next` edges."""
-        yield node
-        # Find and follow an incoming edge
-        for edge in node.get_edges(etype, outgoing=False):
-            yield from self.breadcrumbs(edge.src_node, etype)
-            # Break loop for performance gain
-            break
+        while node is not None:
+            yield node
+            # Find and follow an incoming edge
+            edges = node.get_edges(etype, outgoing=False)
+            node = edges[0].src_node if edges else None
 
     def tree_distance(self, n_1: Node, n_2: Node, etype: Etype) -> int:
         """Returns the tree distance between two nodes following one edge type.
 
         If there are multiple parallel path for the specified edge type only one distance will be returned.
         The one picked does not have to be the shortest path. This does not affect `parent` and `next` edges."""
-        # Follow node breadcrumbs to their source (root) for both nodes individually
-        b_1 = set(self.breadcrumbs(n_1, etype))
-        b_2 = set(self.breadcrumbs(n_2, etype))
-        # Get the length of the difference between both sets
-        # Automatically excludes the node were both breadcrumbs meet and therefore returns the number of edges
-        return len(b_1 ^ b_2)
+        # Follow node breadcrumbs towards their source (root) for both nodes in lockstep
+        # Keep track of the number of edges followed to reach each node
+        walks = [self.breadcrumbs(n_1, etype), self.breadcrumbs(n_2, etype)]
+        seen: List[Dict[Node, int]] = [{}, {}]
+        while walks[0] is not None or walks[1] is not None:
+            for i in (0, 1):
+                if walks[i] is None:
+                    continue
+                node = next(walks[i], None)
+                if node is None or node in seen[i]:
+                    # Reached the source or a cycle
+                    walks[i] = None
+                    continue
+                if node in seen[1 - i]:
+                    # Both breadcrumbs meet, from here on their paths are identical
+                    return len(seen[i]) + seen[1 - i][node]
+                seen[i][node] = len(seen[i])
+        # Breadcrumbs never meet
+        return len(seen[0]) + len(seen[1])
 
     def to_plaintext(self, allow_list: List[str] = None) -> str:
         """Returns a line separated plaintext representation of the graph."""
@@ -346,19 +537,37 @@ class IntertextDocument:
                 nodes.append(str(node))
         return '\n'.join(nodes)
 
+    def get_embeddings(self, nodes: Iterable[Node] = None) -> np.ndarray:
+        """Returns the embeddings of the given nodes, or all nodes, as a single (N, D) matrix."""
+        nodes = self.nodes_view if nodes is None else nodes
+        return np.stack([node.embedding for node in nodes])
+
+    def set_embeddings(self, embeddings: np.ndarray, nodes: Iterable[Node] = None) -> None:
+        """Assigns the rows of an (N, D) matrix as embeddings of the given nodes, or all nodes.
+
+        Nodes keep views on the rows, i.e. all embeddings share one contiguous block of memory."""
+        nodes = list(self.nodes_view if nodes is None else nodes)
+        embeddings = np.ascontiguousarray(embeddings)
+        assert embeddings.ndim == 2 and len(embeddings) == len(nodes)
+        for node, embedding in zip(nodes, embeddings):
+            node.embedding = embedding
+
     @property
-    def node_ix_to_uuid(self) -> Dict[str, uuid4]:
+    def node_ix_to_uuid(self) -> Dict[str, int]:
         return self._node_ix_to_uuid
 
     @property
-    def edge_ix_to_uuid(self) -> Dict[str, uuid4]:
+    def edge_ix_to_uuid(self) -> Dict[str, int]:
+        # Built on first access, afterwards kept up to date when adding or removing edges
+        if self._edge_ix_to_uuid is None:
+            self._edge_ix_to_uuid = {edge.ix: uuid for uuid, edge in self._edges.items()}
         return self._edge_ix_to_uuid
 
     def get_node_by_ix(self, ix: str) -> Node:
         return self._nodes[self._node_ix_to_uuid[ix]]
 
     def get_edge_by_ix(self, ix: str) -> Edge:
-        return self._edges[self._edge_ix_to_uuid[ix]]
+        return self._edges[self.edge_ix_to_uuid[ix]]
 
 
 class SpanNode(Node):
@@ -366,6 +575,8 @@ class SpanNode(Node):
 
     Span nodes and their respective source node are automagically connected over a link edge."""
 
+    __slots__ = ('start', 'end', 'src_node', 'label')
+
     def __init__(
             self,
             ntype: str,
@@ -392,14 +603,22 @@ class SpanNode(Node):
         pass
 
 
+def _node_to_dict(node: Node) -> Dict[str, Any]:
+    data = {'ix': node.ix, 'content': node.content, 'ntype': node.ntype, 'meta': node.meta}
+    if isinstance(node, SpanNode):
+        data.update({'src_ix': node.src_node.ix, 'start': node.start, 'end': node.end, 'label': node.label})
+    return data
+
+
+def _edge_to_dict(edge: Edge) -> Dict[str, Any]:
+    return {'src_ix': edge.src_node.ix, 'tgt_ix': edge.tgt_node.ix, 'etype': str(edge.etype), 'meta': edge.meta}
+
+
 class IntertextEncoder(json.JSONEncoder):
 
     def default(self, o: Any) -> Any:
         if isinstance(o, Edge):
-            return {'src_ix': o.src_node.ix, 'tgt_ix': o.tgt_node.ix, 'etype': str(o.etype), 'meta': o.meta}
+            return _edge_to_dict(o)
         elif isinstance(o, Node):
-            node = {'ix': o.ix, 'content': o.content, 'ntype': o.ntype, 'meta': o.meta}
-            if isinstance(o, SpanNode):
-                node.update({'src_ix': o.src_node.ix, 'start': o.start, 'end': o.end, 'label': o.label})
-            return node
+            return _node_to_dict(o)
         return json.JSONEncoder.default(self, o)
@@ -2,7 +2,7 @@ from __future__ import annotations
 import json
 from typing import Dict, Iterator, List, Optional, TextIO
 
-from intertext_graph.itgraph import Etype, IntertextDocument, Node
+from intertext_graph.itgraph import IntertextDocument, Node
 
 
 class IntertextMultiGraph(IntertextDocument):
@@ -14,23 +14,16 @@ class IntertextMultiGraph(IntertextDocument):
         nodes = []
         edges = []
         # Use meta dict if specified else merge metadata from docs
-        self.meta = kwargs['meta'] if 'meta' in kwargs else {}
+        self.meta = dict(kwargs['meta']) if 'meta' in kwargs else {}
         for doc in args:
-            nodes += doc.nodes
-            edges += doc.edges
+            nodes += doc.nodes_view
+            edges += doc.edges_view
             if 'meta' not in kwargs and doc.meta:
                 self.meta.update(doc.meta)
 
         self._prefix = 'multi'
-        """As we build the new IntertextDocument from existing graphs, set
-        _deserialization to True to avoid creating double edges
-        in IntertextDocument.add_node()."""
-        self._init_from_existing_doc = True
-        for n in nodes:
-            self.add_node(n)
-        for e in edges:
-            self.add_edge(e)
-        self._init_from_existing_doc = False
+        # Add nodes and edges of all docs at once, this does not create double edges for span nodes
+        self._bulk_merge(nodes, edges)
 
     @property
     def root(self) -> Node:
@@ -42,8 +35,8 @@ class IntertextMultiGraph(IntertextDocument):
         """Finds and returns the root nodes.
 
         Requires a graph containing next edges."""
-        for node in self.nodes:
-            if not node.get_edges(Etype.NEXT, outgoing=False) and node.get_edges(Etype.NEXT, incoming=False):
+        for node in self.nodes_view:
+            if self._is_root(node):
                 yield node
 
     @classmethod
@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-import copy
 import logging
 from typing import List, Dict, Tuple
 
@@ -12,6 +11,9 @@ from intertext_graph.itgraph import SpanNode
 
 logger = logging.getLogger(__name__)
 
+# Node types which are split into sentences
+_SPLIT_NTYPES = frozenset({'p', 'article-title'})
+
 
 class SentenceSplitter(ABC):
 
@@ -39,6 +41,14 @@ class SentenceSplitter(ABC):
                 char_ix = char_ix + len(sentence) + 2
         return ret
 
+    def split_batch(
+            self,
+            txts: List[str],
+    ) -> List[List[Tuple[int, int]]]:
+        """Splits multiple texts at once. Override for splitters that benefit from batching."""
+
+        return [self.split(txt) for txt in txts]
+
 
 # Class to add sentences to the "p" nodes of an ITG
 class IntertextSentenceSplitter:
@@ -66,8 +76,9 @@ class IntertextSentenceSplitter:
             self.split_type = 'from_gold'
             self.model_name = 'from_gold'
         else:
+            # Sentence boundaries come from the parser, NER is not needed
             self.splitter = SpacySplitter(
-                spacy.load('en_core_sci_sm')
+                spacy.load('en_core_sci_sm', exclude=['ner'])
             )
             self.split_type = self.splitter.split_type
             self.model_name = self.splitter.model_name
@@ -86,7 +97,7 @@ class IntertextSentenceSplitter:
         else:
             sentence_nodes = self._get_sentences_from_itg()
 
-        out = copy.deepcopy(self.itg)
+        out = self.itg.clone()
         out.meta.update(
             {
                 'sentence_split_type': self.split_type,
@@ -98,10 +109,11 @@ class IntertextSentenceSplitter:
             out.add_node(n)
             edge = out.get_edge_by_ix(f'{n.src_node.ix}_{n.ix}_link')
             meta_update = {'created_by': type(self).__name__}
+            # Replace rather than update the meta dict as it might be shared
             if edge.meta is None:
                 edge.meta = meta_update
             else:
-                edge.meta.update(meta_update)
+                edge.meta = {**edge.meta, **meta_update}
 
         return out
 
@@ -116,16 +128,21 @@ class IntertextSentenceSplitter:
     def _get_sentences_from_itg(self) -> List[SpanNode]:
 
         sentence_nodes = []
-        for node in self.itg.nodes:
-            if node.ntype in ['p', 'article-title']:
-                boundaries = self.splitter.split(node.content)
-
-                new_sentence_nodes = make_sentence_nodes(
-                    node,
-                    boundaries
-                )
+        nodes = [
+            node for node in self.itg.nodes_view
+            if node.ntype in _SPLIT_NTYPES
+        ]
+        # Split all nodes at once to allow the splitter to batch them
+        all_boundaries = self.splitter.split_batch(
+            [node.content for node in nodes]
+        )
+        for node, boundaries in zip(nodes, all_boundaries):
+            new_sentence_nodes = make_sentence_nodes(
+                node,
+                boundaries
+            )
 
-                sentence_nodes += new_sentence_nodes
+            sentence_nodes += new_sentence_nodes
 
         return sentence_nodes
 
@@ -182,11 +199,14 @@ def match_sentences_from_gold_to_itg(
     # Iterate over all paragraphs in gold split data
     for paragraph_ix, paragraph in gold.items():
         paragraph_node = itg.get_node_by_ix(paragraph_ix)
+        # Sentences are ordered, start searching after the previous match
+        offset = 0
         for sentence in paragraph:
             if sentence['text'] != '@q' and sentence['text'] != '':
                 # FIXME: handle erroneous sentences elsewhere
                 try:
-                    boundary = get_span_boundary(sentence['text'].strip(), paragraph_node.content)
+                    boundary = get_span_boundary(sentence['text'].strip(), paragraph_node.content, offset)
+                    offset = boundary[1]
                     sentence_node = make_sentence_node(
                         paragraph_node,
                         boundary,
@@ -217,8 +237,12 @@ def match_sentences_from_gold_to_itg(
 def get_span_boundary(
         span: str,
         full_txt: str,
+        offset: int = 0
 ) -> Tuple[int, int]:
-    start = full_txt.index(span)
+    start = full_txt.find(span, offset)
+    if start < 0:
+        # Fall back to searching the full text in case spans are not in order
+        start = full_txt.index(span)
     end = start + len(span)
 
     return start, end
@@ -266,8 +290,10 @@ def get_span_boundaries(
         full_txt: str
 ) -> List[Tuple[int, int]]:
     boundaries = []
+    offset = 0
     for span in list_of_span_txt:
-        boundaries.append(get_span_boundary(span, full_txt))
+        boundaries.append(get_span_boundary(span, full_txt, offset))
+        offset = boundaries[-1][1]
 
     return boundaries
 
@@ -278,10 +304,12 @@ def get_span_boundaries(
 class SpacySplitter(SentenceSplitter):
     def __init__(
             self,
-            spacy_model: spacy.language.Language
+            spacy_model: spacy.language.Language,
+            batch_size: int = 64
     ) -> None:
 
         self.model = spacy_model
+        self.batch_size = batch_size
         self.split_type = 'spacy'
         self.model_name = self.get_model_name()
 
@@ -290,9 +318,26 @@ class SpacySplitter(SentenceSplitter):
             txt: str,
     ) -> List[Tuple[int, int]]:
 
+        return self._get_boundaries(self.model(txt))
+
+    def split_batch(
+            self,
+            txts: List[str],
+    ) -> List[List[Tuple[int, int]]]:
+
+        return [
+            self._get_boundaries(doc)
+            for doc in self.model.pipe(txts, batch_size=self.batch_size)
+        ]
+
+    @staticmethod
+    def _get_boundaries(
+            doc: spacy.tokens.Doc
+    ) -> List[Tuple[int, int]]:
+
         ret = []
 
-        for sent in self.model(txt).sents:
+        for sent in doc.sents:
             ret.append((sent.start_char, sent.end_char))
 
         return ret
@@ -1,8 +1,8 @@
 from copy import deepcopy
 from importlib.resources import open_text
-from io import BytesIO
 from os import PathLike
-from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+import re
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from lxml import etree
 from lxml.etree import XMLSyntaxError
@@ -12,36 +12,99 @@ from intertext_graph.itgraph import Node, Edge, Etype, IntertextDocument
 from intertext_graph.parsers.itparser import IntertextParser
 from intertext_graph import resources
 
+try:
+    # Linear time matching independent of the number of boilerplate lines
+    import re2
+except ImportError:
+    re2 = None
+
+
+# Compile XPath expressions once instead of on every call
+_VOLUME_XP = etree.XPath('volume')
+_ELOCATION_ID_XP = etree.XPath('elocation-id')
+_PUB_STATUS_XP = etree.XPath('title-group/fn-group/fn/p')
+_ACCEPTED_REF_TYPES = frozenset({'bibr', 'fig', 'table', 'boxed-text', 'sec'})
+_SEC_TITLE_ANCESTORS_XP = etree.XPath('ancestor::sec/title')
+_PREFORMAT_XP = etree.XPath('preformat')
+_BOXED_TEXT_XP = etree.XPath('boxed-text')
+_NESTED_LIST_XP = etree.XPath('.//list')
+
+# Parser options shared by all documents
+# Blank text is kept as it is part of the XML content stored in some nodes
+_PARSER_OPTIONS = {
+    'huge_tree': True,
+    'collect_ids': False,
+    'resolve_entities': False
+}
+
 
 class F1000XMLParser(IntertextParser):
 
+    # Review questionnaire lines, loaded on first use
+    _BOILERPLATE: Optional[Tuple[str, ...]] = None
+    _BOILERPLATE_RE: Optional[Any] = None
+
     def __init__(self, path: Union[PathLike, str]) -> None:
         # TODO: Handle broken xml
         super().__init__(path)
         if isinstance(path, str) and path.startswith('http'):
-            request = requests.get(path)
-            self._root = etree.parse(BytesIO(request.content))
+            # Parse while the response is received instead of buffering it first
+            with requests.get(path, stream=True) as response:
+                response.raw.decode_content = True
+                self._load(response.raw)
         else:
-            with open(path, encoding='utf-8') as xml:
-                self._root = etree.parse(xml)
+            with open(path, 'rb') as xml:
+                self._load(xml)
         self._curr_section = []
         self._xref_targets = {}
 
+    @classmethod
+    def _get_boilerplate(cls) -> Any:
+        """Returns a compiled pattern matching any line of the review boilerplate.
+
+        Uses re2 if it is installed and falls back to re otherwise."""
+        if cls._BOILERPLATE_RE is None:
+            with open_text(resources, 'review_boilerplate.txt') as f:
+                cls._BOILERPLATE = tuple(line.strip() for line in f if line.strip())
+            pattern = '|'.join(map(re.escape, cls._BOILERPLATE))
+            cls._BOILERPLATE_RE = re2.compile(pattern) if re2 is not None else re.compile(pattern)
+        return cls._BOILERPLATE_RE
+
+    def _load(self, xml: BinaryIO) -> None:
+        """Parses the XML tree and collects elements which are otherwise searched in the whole tree in the same pass.
+
+        The tree is kept in memory as parsing requires random access, e.g. to the article meta and references."""
+        self._article_meta = None
+        self._reports = []
+        self._version_changes = []
+        # Start events are emitted in document order with all attributes present
+        context = etree.iterparse(xml, events=('start',), tag=('article-meta', 'sub-article', 'sec'), **_PARSER_OPTIONS)
+        for _, element in context:
+            if element.tag == 'article-meta':
+                if self._article_meta is None:
+                    self._article_meta = element
+            elif element.tag == 'sub-article':
+                if element.get('article-type') == 'ref-report':
+                    self._reports.append(element)
+            elif element.get('sec-type') == 'version-changes':
+                self._version_changes.append(element)
+        self._root = context.root.getroottree()
+
     def get_doc_and_version(self) -> Tuple[str, int]:
         # If the doc has already been parsed return values stored in the meta dict
         if 'doc_id' in self._meta and 'version' in self._meta:
             return self._meta['doc_id'], self._meta['version']
-        meta = self._root.find('.//article-meta')
-        volume = meta.xpath('volume')[0].text
+        meta = self._article_meta
+        volume = _VOLUME_XP(meta)[0].text
         # Elocation id can be prefixed with venue specific strings which are discarded
-        elocation_id = meta.xpath('elocation-id')[0].text.split('-')[-1]
-        for status in meta.xpath('title-group/fn-group/fn/p')[0].text.strip('[]').split(';'):
+        elocation_id = _ELOCATION_ID_XP(meta)[0].text.split('-')[-1]
+        for status in _PUB_STATUS_XP(meta)[0].text.strip('[]').split(';'):
             if status.startswith('version '):
                 return f'{volume}-{elocation_id}', int(status[8:])
         assert False
 
     def _parse_meta(self) -> None:
-        meta = self._root.find('.//article-meta')
+        meta = self._article_meta
         article_id = meta.find('.//article-id[@pub-id-type="doi"]')
         doi = article_id.text if article_id is not None else 'NA'
         atype = self._root.getroot().attrib['article-type']
@@ -67,30 +130,90 @@ class F1000XMLParser(IntertextParser):
     @classmethod
     def _stringify(cls, element: etree._Element) -> str:
         """Stringifies XML elements by removing all nested tags."""
-        children = list(element)
-        if children:
+        # len() counts the children without building a list
+        if len(element):
             return ' '.join(element.itertext()).strip()
         else:
             return element.text
 
     @classmethod
-    def _split_element(cls, element: etree._Element, selector: str) -> List[etree._Element]:
-        """Split an element before and after the selector."""
-        node = deepcopy(element)
-        # TODO: Find a more generic way to remove namespaces
-        leaf = etree.tostring(node.xpath(selector)[0], with_tail=False).decode('utf-8').replace(' xmlns:xlink="http://www.w3.org/1999/xlink"', '')
-        s_0, s_1, s_2 = etree.tostring(node).decode('utf-8').partition(leaf)
-        parser = etree.XMLParser(recover=True)
-        xml_split = [etree.fromstring(s_0, parser), etree.fromstring(s_1, parser)]
-        for e in reversed(list(xml_split[0].iter())):
-            s_2 = f'<{e.tag}>' + s_2
-        xml_split.append(etree.fromstring(s_2, parser))
-        return xml_split
+    def _stringify_paragraph(cls, element: etree._Element) -> Tuple[str, Set[str]]:
+        """Stringifies a paragraph and collects its xrefs in a single pass.
+
+        Equivalent to collecting the xrefs, stripping the xref tags and stringifying the element."""
+        parts = []
+        # A set as a node can contain one reference multiple times but should be linked with a single edge
+        xrefs = set()
+        # Text of consecutive text nodes which are only separated by xref tags
+        buffer = [element.text] if element.text is not None else []
+
+        def walk(curr: etree._Element) -> None:
+            is_xref = curr.tag == 'xref'
+            if is_xref:
+                if curr.get('ref-type') in _ACCEPTED_REF_TYPES and 'rid' in curr.attrib:
+                    xrefs.add(curr.attrib['rid'])
+            elif buffer:
+                parts.append(''.join(buffer))
+                buffer.clear()
+            # Skip text of comments and processing instructions
+            if isinstance(curr.tag, str) and curr.text is not None:
+                buffer.append(curr.text)
+            for child in curr:
+                walk(child)
+            if not is_xref and buffer:
+                parts.append(''.join(buffer))
+                buffer.clear()
+            if curr.tail is not None:
+                buffer.append(curr.tail)
+
+        for child in element:
+            walk(child)
+        if buffer:
+            parts.append(''.join(buffer))
+        return ' '.join(parts).strip(), xrefs
+
+    @classmethod
+    def _split_element(cls, element: etree._Element, selector: etree.XPath) -> List[etree._Element]:
+        """Split an element before and after the selector.
+
+        The selected element can be nested, the ancestors between it and the element are kept on both sides."""
+        before = deepcopy(element)
+        after = deepcopy(element)
+        before.tail = after.tail = None
+        # Drop the selected element and everything following it
+        leaf = selector(before)[0]
+        curr = leaf
+        while curr is not before:
+            parent = curr.getparent()
+            for sibling in list(curr.itersiblings()):
+                parent.remove(sibling)
+            if curr is leaf:
+                # Removes the tail as well
+                parent.remove(curr)
+            else:
+                curr.tail = None
+            curr = parent
+        # Drop the selected element and everything preceding it
+        # The selected element is detached from this copy instead of being copied separately
+        selected = selector(after)[0]
+        curr = selected
+        while curr is not after:
+            parent = curr.getparent()
+            for sibling in list(curr.itersiblings(preceding=True)):
+                parent.remove(sibling)
+            parent.text = None
+            if curr is selected:
+                # Keep the text following the selected element
+                parent.text = curr.tail
+                parent.remove(curr)
+                curr.tail = None
+            curr = parent
+        return [before, selected, after]
 
     @classmethod
-    def _elevate_element(cls, element: etree._Element, selector: str) -> List[etree._Element]:
+    def _elevate_element(cls, element: etree._Element, selector: etree.XPath) -> List[etree._Element]:
         # Remove boxed text from the current paragraph and elevate it to its parent node
-        node = element.xpath(selector)
+        node = selector(element)
         element.remove(node[0])
         # If there are siblings elevate the node otherwise replace its parent
         # There would be multiple roots otherwise
@@ -116,7 +239,9 @@ class F1000XMLParser(IntertextParser):
 
     @classmethod
     def _make_xml_node(cls, element: etree._Element, meta: Dict[str, Any] = None) -> Node:
-        content = cls._parse_whitespace(etree.tostring(element).decode('utf-8'))
+        # The default serialization is ASCII with character references which are part of the stored content
+        # encoding='unicode' would turn them into characters, e.g. non-breaking spaces would be collapsed
+        content = cls._parse_whitespace(etree.tostring(element).decode('ascii'))
         return super()._make_node(content, element.tag, meta)
 
     @classmethod
@@ -124,24 +249,24 @@ class F1000XMLParser(IntertextParser):
         meta = {}
         if 'id' in element.attrib:
             meta['id'] = element.attrib['id']
-        caption = element.xpath('caption')
-        if caption:
-            meta['caption'] = cls._parse_whitespace(cls._stringify(caption[0]))
-        graphic = element.xpath('graphic')
-        if graphic:
-            for key, value in graphic[0].attrib.items():
+        # Single child lookups with find() avoid the overhead of evaluating an XPath
+        caption = element.find('caption')
+        if caption is not None:
+            meta['caption'] = cls._parse_whitespace(cls._stringify(caption))
+        graphic = element.find('graphic')
+        if graphic is not None:
+            for key, value in graphic.attrib.items():
                 # F1000 key is {http://www.w3.org/1999/xlink}href
                 if key.endswith('href'):
                     meta['uri'] = value
         return meta if len(meta) > 0 else None
 
-    def _generate_sec_index(self, element: etree._Element) -> str:
-        """Get current section depth by counting ancestor tags.
+    def _generate_sec_index(self, ancestors: int) -> str:
+        """Get current section index from the number of ancestor sections with a title tag.
 
         Can handle multiple levels of subsections.
         """
-        # Checking for an existing title tag is important as only those are represented in the graph
-        ancestors = len(element.xpath(f'ancestor::{element.tag}/title'))
+        # Only called for sec elements
         # Reduce current section depth based on ancestors
         # This resets the list when ascending in the subsection path
         self._curr_section = self._curr_section[:ancestors + 1]
@@ -153,88 +278,105 @@ class F1000XMLParser(IntertextParser):
         # Concatenate potential subsection levels
         return '.'.join(map(lambda x: str(x), self._curr_section))
 
-    @classmethod
-    def _collect_xrefs(cls, element: etree._Element) -> Set[str]:
-        """Collects xrefs for fig, table, boxed-text, and sec."""
-        xrefs = element.xpath('.//xref[@rid and (@ref-type="bibr" or @ref-type="fig" or @ref-type="table" or @ref-type="boxed-text" or @ref-type="sec")]')
-        # Return a set as a node can contain one reference multiple times but should be linked with a single edge
-        return {xref.attrib['rid'] for xref in xrefs}
+    def _parse_body(self, element: etree._Element, children: List[etree._Element], sec_depth: int) -> Tuple[Optional[Node], List[etree._Element]]:
+        return None, children
 
-    def _parse_element(self, element: etree._Element) -> Tuple[Optional[Node], List[etree._Element]]:
+    def _parse_abstract(self, element: etree._Element, children: List[etree._Element], sec_depth: int) -> Tuple[Optional[Node], List[etree._Element]]:
+        return self._make_node(element), children
+
+    def _parse_sec(self, element: etree._Element, children: List[etree._Element], sec_depth: int) -> Tuple[Optional[Node], List[etree._Element]]:
+        # Move the title child to the root node of a section
+        title_element = element.find('title')
+        if title_element is not None and title_element.text:
+            meta = {'section': self._generate_sec_index(sec_depth)}
+            if 'id' in element.attrib:
+                meta['id'] = element.attrib['id']
+            if 'sec-type' in element.attrib:
+                meta['sec-type'] = element.attrib['sec-type']
+            node = self._make_node(title_element, stringify=True, meta=meta)
+            children.remove(title_element)
+            # Keep track of potential xref targets
+            if meta and 'id' in meta:
+                self._xref_targets[meta['id']] = node
+        else:
+            # Section has no title
+            node = None
+        return node, children
+
+    def _parse_list(self, element: etree._Element, children: List[etree._Element], sec_depth: int) -> Tuple[Optional[Node], List[etree._Element]]:
+        # Concatenate list items with new line
+        # Do not pass through _make_node() or new lines will be removed
+        content = '\n'.join([f'- {self._parse_whitespace(self._stringify(e))}' for e in element.iterchildren('list-item')])
+        ntype = element.tag
+        node = super()._make_node(content, ntype)
+        # Drop children
+        return node, []
+
+    def _parse_p(self, element: etree._Element, children: List[etree._Element], sec_depth: int) -> Tuple[Optional[Node], List[etree._Element]]:
+        # Stringify paragraphs, drop all inline tags
+        tags = [e.tag for e in element.iterdescendants()]
+        if 'boxed-text' in tags:
+            # Boxed text has to be processed before other nested types as is might contain these as children
+            return None, self._elevate_element(element, _BOXED_TEXT_XP)
+        elif element.find('preformat') is not None:
+            # Elevate immediate children but ignore nested inline tags
+            return None, self._elevate_element(element, _PREFORMAT_XP)
+        elif 'list' in tags:
+            # Split paragraph before and after an inline list
+            # A human would probably read this as separate paragraphs
+            return None, self._split_element(element, _NESTED_LIST_XP)
+        # Drop inline xref but add metadata for them which will later be parsed into edges
+        content, xrefs = self._stringify_paragraph(element)
+        # Strip the xref tags in the tree as well
+        # Subtrees can be parsed again, e.g. version changes for the revision, and must not link the same targets
+        etree.strip_tags(element, 'xref')
+        content = self._parse_whitespace(content)
+        meta = {'xrefs': xrefs} if xrefs else None
+        node = super()._make_node(content, element.tag, meta) if content else None
+        # Drop children
+        return node, []
+
+    def _parse_figlike(self, element: etree._Element, children: List[etree._Element], sec_depth: int) -> Tuple[Optional[Node], List[etree._Element]]:
+        """Parses fig, table-wrap, and boxed-text elements."""
+        # Get optional meta data
+        meta = self._parse_node_meta(element)
+        label_element = element.find('label')
+        if label_element is not None:
+            # Move the label child to the root node
+            node = self._make_node(label_element, stringify=True, meta=meta)
+            # Remove the label tag and do another recursive call to parse element as an XML node
+            etree.strip_elements(element, 'label', with_tail=False)
+            children = [element]
+        else:
+            # Handle second recursive call or cases where there is no label
+            node = self._make_xml_node(element, meta=meta)
+            # Drop children
+            children = []
+        # Keep track of potential xref targets
+        if meta and 'id' in meta:
+            self._xref_targets[meta['id']] = node
+        return node, children
+
+    # Handlers for elements with children by tag, looked up once per element instead of comparing each tag
+    # Handlers are stored by name so subclasses can override them
+    _TAG_DISPATCH = {
+        'body': '_parse_body',
+        'abstract': '_parse_abstract',
+        'sec': '_parse_sec',
+        'list': '_parse_list',
+        'p': '_parse_p',
+        'fig': '_parse_figlike',
+        'table-wrap': '_parse_figlike',
+        'boxed-text': '_parse_figlike'
+    }
+
+    def _parse_element(self, element: etree._Element, sec_depth: int = 0) -> Tuple[Optional[Node], List[etree._Element]]:
         children = list(element)
         if children:
             # Parse nodes with children, i.e. subtrees
-            if element.tag == 'body':
-                return None, children
-            elif element.tag == 'abstract':
-                node = self._make_node(element)
-            elif element.tag == 'sec':
-                # Move the title child to the root node of a section
-                title_element = element.xpath('title')
-                if title_element and title_element[0].text:
-                    meta = {'section': self._generate_sec_index(element)}
-                    if 'id' in element.attrib:
-                        meta['id'] = element.attrib['id']
-                    if 'sec-type' in element.attrib:
-                        meta['sec-type'] = element.attrib['sec-type']
-                    node = self._make_node(title_element[0], stringify=True, meta=meta)
-                    children.remove(title_element[0])
-                    # Keep track of potential xref targets
-                    if meta and 'id' in meta:
-                        self._xref_targets[meta['id']] = node
-                else:
-                    # Section has no title
-                    node = None
-            elif element.tag == 'list':
-                # Concatenate list items with new line
-                # Do not pass through _make_node() or new lines will be removed
-                content = '\n'.join([f'- {self._parse_whitespace(self._stringify(e))}' for e in element.xpath('list-item')])
-                ntype = element.tag
-                node = super()._make_node(content, ntype)
-                # Drop children
-                children = []
-            elif element.tag == 'p':
-                # Stringify paragraphs, drop all inline tags
-                tags = [e.tag for e in element.iterdescendants()]
-                if 'boxed-text' in tags:
-                    # Boxed text has to be processed before other nested types as is might contain these as children
-                    return None, self._elevate_element(element, 'boxed-text')
-                elif element.xpath('preformat'):
-                    # Elevate immediate children but ignore nested inline tags
-                    return None, self._elevate_element(element, 'preformat')
-                elif 'list' in tags:
-                    # Split paragraph before and after an inline list
-                    # A human would probably read this as separate paragraphs
-                    return None, self._split_element(element, './/list')
-                meta = None
-                # Add metadata for xrefs which will later be parsed into edges
-                if 'xref' in tags:
-                    xrefs = self._collect_xrefs(element)
-                    if xrefs:
-                        meta = {'xrefs': xrefs}
-                # Drop inline xref
-                etree.strip_tags(element, 'xref')
-                node = self._make_node(element, stringify=True, meta=meta)
-                # Drop children
-                children = []
-            elif element.tag in ['fig', 'table-wrap', 'boxed-text']:
-                # Get optional meta data
-                meta = self._parse_node_meta(element)
-                label_element = element.xpath('label')
-                if label_element:
-                    # Move the label child to the root node
-                    node = self._make_node(element.xpath('label')[0], stringify=True, meta=meta)
-                    # Remove the label tag and do another recursive call to parse element as an XML node
-                    etree.strip_elements(element, 'label', with_tail=False)
-                    children = [element]
-                else:
-                    # Handle second recursive call or cases where there is no label
-                    node = self._make_xml_node(element, meta=meta)
-                    # Drop children
-                    children = []
-                # Keep track of potential xref targets
-                if meta and 'id' in meta:
-                    self._xref_targets[meta['id']] = node
+            handler = self._TAG_DISPATCH.get(element.tag)
+            if handler is not None:
+                return getattr(self, handler)(element, children, sec_depth)
             elif 'formula' in element.tag:
                 # Discard for now
                 return None, []
@@ -247,12 +389,29 @@ class F1000XMLParser(IntertextParser):
             node = self._make_node(element, stringify=True)
         return node, children
 
-    def _parse_tree(self, curr_root: etree._Element, parent: Node = None) -> Tuple[List[Node], List[Edge]]:
-        """Takes the <body> tag as first input."""
+    def _parse_tree(
+            self,
+            curr_root: etree._Element,
+            parent: Node = None,
+            nodes: List[Node] = None,
+            edges: List[Edge] = None,
+            sec_depth: int = None) -> Tuple[List[Node], List[Edge]]:
+        """Takes the <body> tag as first input.
+
+        Nodes and edges are appended to the given lists which are shared across the recursion.
+        The section depth is the number of ancestor sections with a title tag."""
+        if nodes is None:
+            nodes = []
+        if edges is None:
+            edges = []
+        if sec_depth is None:
+            # Sections above the initial root still count towards the depth
+            sec_depth = len(_SEC_TITLE_ANCESTORS_XP(curr_root))
         # Parse the root node
-        node, children = self._parse_element(curr_root)
-        nodes = []
-        edges = []
+        node, children = self._parse_element(curr_root, sec_depth)
+        if curr_root.tag == 'sec':
+            # Checking for an existing title tag is important as only those are represented in the graph
+            sec_depth += len(curr_root.findall('title'))
         if node is not None:
             nodes.append(node)
             if parent is not None:
@@ -262,21 +421,30 @@ class F1000XMLParser(IntertextParser):
             node = parent
         # Recursive call on each child
         for child in children:
-            n, e = self._parse_tree(child, node)
-            if len(n) == 1:  # TODO: Check if condition is sufficient
+            num_nodes, num_edges = len(nodes), len(edges)
+            self._parse_tree(child, node, nodes, edges, sec_depth)
+            if len(nodes) - num_nodes == 1:  # TODO: Check if condition is sufficient
                 # TODO: Implement proper parsing, see https://f1000research.com/for-referees/guidelines#rar
-                for line in open_text(resources, 'review_boilerplate.txt'):
-                    if line.strip() in n[0].content:
-                        # Drop questionnaire nodes
-                        return nodes, edges
-            nodes += n
-            edges += e
+                if self._get_boilerplate().search(nodes[-1].content):
+                    # Drop questionnaire nodes
+                    del nodes[num_nodes:]
+                    del edges[num_edges:]
+                    return nodes, edges
         return nodes, edges
 
     def _parse_refs(self, ref_list: etree._Element) -> None:
         # Do not add ref nodes to the graph yet otherwise they would become part of the next graph
-        for ref in ref_list:
-            self._xref_targets[ref.attrib['id']] = self._make_node(ref, stringify=True, meta={'id': ref.attrib['id']})
+        # Refs without an id cannot be referenced
+        self._xref_targets.update({
+            ref_id: self._make_node(ref, stringify=True, meta={'id': ref_id})
+            for ref in ref_list if (ref_id := ref.get('id')) is not None
+        })
+
+    @staticmethod
+    def _index_xrefs(node: Node, referrers: Dict[str, Node]) -> None:
+        if node.meta is not None and 'xrefs' in node.meta:
+            for key in node.meta['xrefs']:
+                referrers.setdefault(key, node)
 
     def _add_supplementary_edges(self, nodes: List, edges: List) -> None:
         """Adds next and ref edges."""
@@ -287,16 +455,23 @@ class F1000XMLParser(IntertextParser):
                 edges.append(super()._make_edge(prev, curr, Etype.NEXT))
             prev = curr
         # Add ref edges
+        # Map each xref to the first node referencing it instead of scanning all nodes per target
+        referrers = {}
+        for node in nodes:
+            self._index_xrefs(node, referrers)
+        included = {id(node) for node in nodes}
         for key, tgt_node in self._xref_targets.items():
-            for node in nodes:
-                # As of now supplementary material is not supported, therefore some xrefs have no target node
-                if node.meta is not None and 'xrefs' in node.meta and key in node.meta['xrefs']:
-                    edges.append(super()._make_edge(node, tgt_node, Etype.LINK))
-                    # Add target nodes to the graph after computing the next graph
-                    # Disconnected references are dropped
-                    if tgt_node not in nodes:
-                        nodes.append(tgt_node)
-                    break
+            # As of now supplementary material is not supported, therefore some xrefs have no target node
+            node = referrers.get(key)
+            if node is not None:
+                edges.append(super()._make_edge(node, tgt_node, Etype.LINK))
+                # Add target nodes to the graph after computing the next graph
+                # Disconnected references are dropped
+                if id(tgt_node) not in included:
+                    included.add(id(tgt_node))
+                    nodes.append(tgt_node)
+                    # Appended target nodes may reference targets that come later
+                    self._index_xrefs(tgt_node, referrers)
         for node in nodes:
             if node.meta is not None and 'xrefs' in node.meta:
                 # Clean up temporary helper data
@@ -311,9 +486,7 @@ class F1000XMLParser(IntertextParser):
         abstract = element.find('.//abstract')
         # Abstract is optional, e.g. in reviews
         if abstract is not None:
-            n, e = self._parse_tree(abstract, title_node)
-            nodes += n
-            edges += e
+            self._parse_tree(abstract, title_node, nodes, edges)
         # Parse refs
         # TODO: Look into ways to parse fn-group tags
         ref_list = element.findall('back/ref-list/ref')
@@ -321,9 +494,7 @@ class F1000XMLParser(IntertextParser):
             self._parse_refs(ref_list)
         body = element.find('body')
         if body is not None:
-            n, e = self._parse_tree(body, title_node)
-            nodes += n
-            edges += e
+            self._parse_tree(body, title_node, nodes, edges)
         else:
             # TODO: Why does this happen?
             return None
@@ -341,7 +512,7 @@ class F1000XMLParser(IntertextParser):
         main_doc = self._parse(self._root, self._meta, prefix or 'doc')
         # Reviews
         reviews = {}
-        for review in self._root.xpath('.//sub-article[@article-type="ref-report"]'):
+        for review in self._reports:
             review_id = review.attrib['id']
             license = review.find('.//license').attrib['{http://www.w3.org/1999/xlink}href']
             recommendation = review.find('.//meta-value').text  # TODO: A bit dirty here
@@ -356,7 +527,7 @@ class F1000XMLParser(IntertextParser):
             meta = {'review_id': review_id, 'license': license, 'recommendation': recommendation, 'doi': doi, 'contributors': contributors}
             reviews[review_id] = self._parse(review, meta, review_id)
         # Revision comment
-        version_changes = self._root.xpath('.//sec[@sec-type="version-changes"]')
+        version_changes = self._version_changes
         if version_changes:
             # TODO: Check if any nodes need additional parsing
             nodes, edges = self._parse_tree(version_changes[-1])
@@ -379,5 +550,9 @@ class F1000XMLParser(IntertextParser):
             return None
 
     @classmethod
-    def batch_parse(cls, files: List[Union[PathLike, str]]) -> Iterator[Tuple[IntertextDocument, Dict[str, IntertextDocument], Optional[IntertextDocument]]]:
-        return super().batch_parse(files)
+    def _init_worker(cls) -> None:
+        cls._get_boilerplate()
+
+    @classmethod
+    def batch_parse(cls, files: List[Union[PathLike, str]], start_method: str = None) -> Iterator[Tuple[IntertextDocument, Dict[str, IntertextDocument], Optional[IntertextDocument]]]:
+        return super().batch_parse(files, start_method)
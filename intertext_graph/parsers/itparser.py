@@ -1,6 +1,7 @@
-from multiprocessing import Pool
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+from multiprocessing import get_context
 from os import PathLike
-import pkg_resources
 import re
 from typing import Any, Dict, Iterator, List, Union
 from warnings import warn
@@ -10,13 +11,23 @@ from tqdm import tqdm
 from intertext_graph.itgraph import Edge, Etype, Node, SpanNode
 from intertext_graph.parsers.utils import chunksize, num_processes
 
+# Looked up once, querying the installed distributions is slow
+try:
+    _PKG_VERSION = version('intertext-graph')
+except PackageNotFoundError:
+    _PKG_VERSION = 'N/A'
+
 
 class IntertextParser:
 
+    # Whitespace is mapped to spaces first, so runs only have to be collapsed when present
+    _WS_TRANS = str.maketrans({'\n': ' ', '\t': ' ', '\u00a0': ' '})
+    _WS_RE = re.compile(r' {2,}')
+
     def __init__(self, path: Union[PathLike, str]) -> None:
         self._meta = {
             'parser': type(self).__name__,
-            'intertext-graph': pkg_resources.require('intertext-graph')[0].version
+            'intertext-graph': _PKG_VERSION
         }
 
     @classmethod
@@ -54,7 +65,9 @@ class IntertextParser:
     @classmethod
     def _parse_whitespace(cls, text: str) -> str:
         # This replaces line breaks, tabs, spaces, and non-breaking spaces (both as a string and unicode character)
-        text = re.sub(r'[\n\t   ]+', ' ', text)
+        text = text.translate(cls._WS_TRANS)
+        if '  ' in text:
+            text = cls._WS_RE.sub(' ', text)
         return text.strip()
 
     def parse(self) -> Any:
@@ -69,15 +82,25 @@ class IntertextParser:
         raise NotImplementedError
 
     @classmethod
-    def batch_parse(cls, files: List[Any]) -> Iterator[Any]:
-        """Parse a list of files using multiprocessing."""
+    def _init_worker(cls) -> None:
+        """Runs once in every worker process before parsing, e.g. to load shared resources."""
+        pass
+
+    @classmethod
+    def batch_parse(cls, files: List[Any], start_method: str = None) -> Iterator[Any]:
+        """Parse a list of files using multiprocessing.
+
+        The start method of the worker processes defaults to the platform default.
+        'forkserver' avoids forking a large parent process but requires the calling script to guard its entry point
+        with if __name__ == '__main__'."""
         total = len(files)
-        with Pool(processes=num_processes()) as pool:
+        with ProcessPoolExecutor(
+                max_workers=num_processes(),
+                mp_context=get_context(start_method) if start_method else None,
+                initializer=cls._init_worker) as executor:
             for parsed in tqdm(
-                    pool.imap_unordered(cls._batch_func, files, chunksize(total)),
+                    executor.map(cls._batch_func, files, chunksize=chunksize(total)),
                     total=total,
                     desc='parsing documents'):
                 if parsed:
                     yield parsed
-            pool.close()
-            pool.join()
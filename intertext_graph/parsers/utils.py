@@ -1,3 +1,4 @@
+from functools import lru_cache
 from multiprocessing import cpu_count
 from sys import platform
 import subprocess
@@ -9,6 +10,7 @@ def chunksize(total: int) -> int:
     return max(1, min(max_chunksize, total // processes))  # Reduce amount of context switches
 
 
+@lru_cache(maxsize=1)
 def num_processes() -> int:
     if platform == 'darwin':
         # On macOS return number of performance cores
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+from intertext_graph.itgraph import Etype
+from intertext_graph.parsers.f1000_xml_parser import F1000XMLParser
+
+
+EXAMPLE = Path(__file__).resolve().parent.parent / 'tutorial' / 'example_data' / '207_6-229_v1.xml'
+
+VERSION_CHANGES = '''<body>
+        <sec sec-type="version-changes">
+            <title>Amendments from Version 1</title>
+            <p>We revised <xref ref-type="fig" rid="f1">Figure 1</xref> and cite <xref ref-type="bibr" rid="ref-1">Alberts</xref>.</p>
+        </sec>
+'''
+
+
+def test_version_changes_with_xrefs(tmp_path):
+    # Version changes in the body are parsed for both the main document and the revision
+    path = tmp_path / 'version_changes.xml'
+    path.write_text(EXAMPLE.read_text(encoding='utf-8').replace('<body>\n', VERSION_CHANGES, 1), encoding='utf-8')
+    doc, _, revision = F1000XMLParser(path)()
+
+    # The main document links the xrefs
+    paragraph = next(node for node in doc.nodes if node.content.startswith('We revised'))
+    assert paragraph.content == 'We revised Figure 1 and cite Alberts.'
+    assert {edge.tgt_node.meta['id'] for edge in paragraph.get_edges(Etype.LINK)} == {'f1', 'ref-1'}
+
+    # The revision does not take over xref targets of the main document
+    assert [node.content for node in revision.nodes] == ['Amendments from Version 1', paragraph.content]
+    assert revision.edges and all(edge.etype != Etype.LINK for edge in revision.edges)
+    assert all(node._doc is doc for node in doc.nodes)
+    assert len(doc.unroll_graph()) == 48
+
+
+def test_subclass_overrides_tag_handler():
+    class NoListParser(F1000XMLParser):
+        def _parse_list(self, element, children, sec_depth):
+            return None, []
+
+    calls = []
+
+    class TracingParser(F1000XMLParser):
+        def _parse_sec(self, element, children, sec_depth):
+            calls.append(element)
+            return super()._parse_sec(element, children, sec_depth)
+
+    TracingParser(EXAMPLE)()
+    assert calls
+    doc, _, _ = NoListParser(EXAMPLE)()
+    assert all(node.ntype != 'list' for node in doc.nodes)